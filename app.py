@@ -1,4 +1,12 @@
+import os
+import tempfile
+from functools import cache as memoize
+from pathlib import Path
+
 from flask import Flask, render_template, abort, request
+from flask_caching import Cache
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.local import LocalProxy
 from utils.context import ContextManager
 from utils.blog_engine import get_blog_engine
 from utils.knowledge_base_manager import get_kb_manager
@@ -6,6 +14,29 @@ from utils.projects_engine import get_projects_engine
 
 app = Flask(__name__, template_folder="templates")
 
+# Rendered-page cache: the read-only views are pure functions of the
+# files on disk, so cache their responses for a few minutes. Disabled
+# in development (python app.py, FLASK_DEBUG=1, or the compose dev
+# service's FLASK_ENV=development) so edits show up immediately; in
+# production staleness is bounded by the timeout.
+IS_DEV = (
+    __name__ == "__main__"
+    or os.environ.get("FLASK_DEBUG") == "1"
+    or os.environ.get("FLASK_ENV") == "development"
+)
+cache = Cache(app, config={
+    "CACHE_TYPE": "NullCache" if IS_DEV else "SimpleCache",
+    "CACHE_DEFAULT_TIMEOUT": 300,
+})
+
+# Persist compiled Jinja templates across worker starts so each
+# gunicorn worker doesn't re-parse every .html on its first render.
+# Only development re-checks template mtimes per render.
+_JINJA_CACHE_DIR = Path(tempfile.gettempdir()) / "muhsinkompas_jinja_cache"
+_JINJA_CACHE_DIR.mkdir(exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=str(_JINJA_CACHE_DIR))
+app.jinja_env.auto_reload = IS_DEV
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -23,11 +54,18 @@ FILES = {
     "resume": "resume_MuhsinKompas.pdf",
 }
 
-# Initialize context manager, blog engine, knowledge base, and projects
-PCTX = ContextManager("./data/personal_info.json")
-blog = get_blog_engine()
-kb = get_kb_manager()
-projects = get_projects_engine()
+# Context manager, blog engine, knowledge base, and projects are lazy:
+# each worker only builds the engines its routes actually touch, so
+# e.g. serving /cv never initializes the markdown pipelines.
+@memoize
+def _get_context_manager() -> ContextManager:
+    return ContextManager("./data/personal_info.json")
+
+
+PCTX = LocalProxy(_get_context_manager)
+blog = LocalProxy(get_blog_engine)
+kb = LocalProxy(get_kb_manager)
+projects = LocalProxy(get_projects_engine)
 
 
 # =============================================================================
@@ -35,27 +73,29 @@ projects = get_projects_engine()
 # =============================================================================
 
 @app.route("/blog")
-def blog_list():
-    """Display list of all blog posts."""
-    # Get optional tag filter
-    tag_filter = request.args.get("tag")
-    
+@app.route("/blog/tag/<tag>")
+@cache.cached(query_string=True)
+def blog_list(tag=None):
+    """Display list of all blog posts, optionally filtered by tag."""
+    # Tag filter comes from the path or the query string
+    tag_filter = tag or request.args.get("tag")
+
     if tag_filter:
         posts = blog.get_posts_by_tag(tag_filter)
+        # Keep the old /blog/tag/<tag> behavior: unknown tag is a 404
+        if tag is not None and not posts:
+            abort(404)
         page_title = f"Posts tagged '{tag_filter}'"
     else:
         posts = blog.get_all_posts()
         page_title = "Blog"
-    
+
     # Get all tags for sidebar/filter
     all_tags = blog.get_all_tags()
-    
-    # Convert posts to dict for template
-    posts_data = [post.to_dict() for post in posts]
-    
+
     return render_template(
         "blog_list.html",
-        posts=posts_data,
+        posts=posts,
         all_tags=all_tags,
         current_tag=tag_filter,
         page_title=page_title,
@@ -76,32 +116,11 @@ def blog_detail(slug):
     
     # Get related posts
     related_posts = blog.get_related_posts(post, limit=3)
-    related_posts_data = [p.to_dict() for p in related_posts]
-    
-    return render_template(
-        "blog_detail.html",
-        post=post.to_dict(),
-        related_posts=related_posts_data,
-    )
-
 
-@app.route("/blog/tag/<tag>")
-def blog_by_tag(tag):
-    """Display posts filtered by tag."""
-    posts = blog.get_posts_by_tag(tag)
-    
-    if not posts:
-        abort(404)
-    
-    all_tags = blog.get_all_tags()
-    posts_data = [post.to_dict() for post in posts]
-    
     return render_template(
-        "blog_list.html",
-        posts=posts_data,
-        all_tags=all_tags,
-        current_tag=tag,
-        page_title=f"Posts tagged '{tag}'",
+        "blog_detail.html",
+        post=post,
+        related_posts=related_posts,
     )
 
 
@@ -110,27 +129,31 @@ def blog_by_tag(tag):
 # =============================================================================
 
 @app.route("/projects")
-def projects_list():
-    """Display list of all projects."""
-    # Get optional tag filter
-    tag_filter = request.args.get("tag")
-    
+@app.route("/projects/tag/<tag>")
+@cache.cached(query_string=True)
+def projects_list(tag=None):
+    """Display list of all projects, optionally filtered by tag."""
+    # Tag filter comes from the path or the query string
+    tag_filter = tag or request.args.get("tag")
+
     if tag_filter:
         project_items = projects.get_projects_by_tag(tag_filter)
+        # Keep the old /projects/tag/<tag> behavior: unknown tag is a 404
+        if tag is not None and not project_items:
+            abort(404)
         page_title = f"Projects tagged '{tag_filter}'"
     else:
         project_items = projects.get_all_projects()
         page_title = "Projects"
-    
+
     # Get all tags for sidebar/filter
     all_tags = projects.get_all_tags()
-    
-    # Convert projects to dict for template
-    projects_data = [proj.to_dict() for proj in project_items]
-    
+
+    # Project objects render fine in templates, and passing them
+    # directly keeps list pages from touching the rendered HTML
     return render_template(
         "projects_list.html",
-        projects=projects_data,
+        projects=project_items,
         all_tags=all_tags,
         current_tag=tag_filter,
         page_title=page_title,
@@ -151,27 +174,7 @@ def project_detail(slug):
     
     return render_template(
         "project_detail.html",
-        project=project.to_dict(),
-    )
-
-
-@app.route("/projects/tag/<tag>")
-def projects_by_tag(tag):
-    """Display projects filtered by tag."""
-    project_items = projects.get_projects_by_tag(tag)
-    
-    if not project_items:
-        abort(404)
-    
-    all_tags = projects.get_all_tags()
-    projects_data = [proj.to_dict() for proj in project_items]
-    
-    return render_template(
-        "projects_list.html",
-        projects=projects_data,
-        all_tags=all_tags,
-        current_tag=tag,
-        page_title=f"Projects tagged '{tag}'",
+        project=project,
     )
 
 
@@ -180,6 +183,7 @@ def projects_by_tag(tag):
 # =============================================================================
 
 @app.route("/cv")
+@cache.cached(query_string=True)
 def cv():
     """Display CV page with embedded PDF."""
     return render_template("cv.html", files=FILES, contact=PCTX.contact)
@@ -190,22 +194,18 @@ def cv():
 # =============================================================================
 
 @app.route("/")
+@cache.cached(query_string=True)
 def index():
     """Display the homepage."""
     # Get recent blog posts for the wiki section
     recent_posts = blog.get_recent_posts(limit=3)
-    recent_posts_data = [post.to_dict() for post in recent_posts]
-    
-    # Get terminals from knowledge base
-    terminals = kb.get_terminals()
-    terminals_data = [term.to_dict() for term in terminals]
-    
+
+    # Get terminals from knowledge base (dicts prebuilt at load time)
+    terminals_data = kb.get_terminals_dicts()
+
     # Get featured projects for projects section
     featured_projects = projects.get_featured_projects(limit=3)
-    featured_projects_data = [proj.to_dict() for proj in featured_projects]
-    
-    print("hobbies:")
-    print(PCTX.hobbies)
+
     return render_template(
         "index.html",
         images=IMAGES,
@@ -214,10 +214,10 @@ def index():
         timeline=PCTX.timeline,
         personal_info=PCTX.personal,
         contact=PCTX.contact,
-        recent_posts=recent_posts_data,
+        recent_posts=recent_posts,
         hobbies=PCTX.hobbies,
         terminals=terminals_data,
-        featured_projects=featured_projects_data,
+        featured_projects=featured_projects,
     )
 
 
@@ -6,13 +6,18 @@ Handles scanning, parsing, and caching of Markdown blog posts.
 
 from __future__ import annotations
 
+import heapq
 import os
 import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import frontmatter
 import markdown
@@ -27,14 +32,19 @@ POSTS_DIR = Path("./posts")
 DEFAULT_AUTHOR = "Muhsin Kompas"
 DATE_FORMAT = "%Y-%m-%d"
 
+# Precompiled patterns (these run once per post per cache refresh)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_DATE_PREFIX_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+_SLUG_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}-(.+)$")
 
-@dataclass
+
+@dataclass(slots=True)
 class BlogPost:
     """Represents a single blog post."""
     slug: str
     title: str
     date: datetime
-    content_html: str
     content_raw: str
     excerpt: str
     tags: List[str] = field(default_factory=list)
@@ -43,16 +53,40 @@ class BlogPost:
     reading_time: int = 1
     is_draft: bool = False
     meta: Dict[str, Any] = field(default_factory=dict)
+    _render_html: Optional[Callable[[str], str]] = field(default=None, repr=False, compare=False)
+    _content_html: Optional[str] = field(default=None, init=False, repr=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    tags_lower: frozenset = field(init=False, repr=False)
+    date_formatted: str = field(init=False)
+    date_iso: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Precompute the lowercased tag set once so tag filtering and
+        # related-post scoring never re-lower tags per request
+        self.tags_lower = frozenset(t.lower() for t in self.tags)
+        # Precompute the display dates; strftime is cheap but was being
+        # called for every post on every rendered list page
+        self.date_formatted = self.date.strftime("%B %d, %Y")
+        self.date_iso = self.date.strftime(DATE_FORMAT)
 
     @property
-    def date_formatted(self) -> str:
-        """Return formatted date string."""
-        return self.date.strftime("%B %d, %Y")
+    def content_html(self) -> str:
+        """
+        Rendered HTML body, produced lazily on first access.
+
+        Cache refreshes only pay the frontmatter parse; the Markdown
+        render happens when a post is actually viewed and is then
+        memoized on the instance.
+        """
+        if self._content_html is None:
+            render = self._render_html
+            self._content_html = render(self.content_raw) if render else self.content_raw
+        return self._content_html
 
     @property
-    def date_iso(self) -> str:
-        """Return ISO formatted date string."""
-        return self.date.strftime("%Y-%m-%d")
+    def content(self) -> str:
+        """Alias used by the templates for the rendered body."""
+        return self.content_html
 
     @property
     def year(self) -> int:
@@ -65,8 +99,17 @@ class BlogPost:
         return self.date.month
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert post to dictionary for template rendering."""
-        return {
+        """
+        Convert post to dictionary for template rendering.
+
+        The dict is built once and cached on the instance, so repeated
+        calls (one per post per request in the list routes) return the
+        same dict instead of rebuilding it. Posts are recreated on cache
+        refresh, so the cached dict never goes stale.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+        self._cached_dict = {
             "slug": self.slug,
             "title": self.title,
             "date": self.date,
@@ -82,6 +125,7 @@ class BlogPost:
             "is_draft": self.is_draft,
             "meta": self.meta,
         }
+        return self._cached_dict
 
 
 class BlogEngine:
@@ -95,15 +139,31 @@ class BlogEngine:
     def __init__(self, posts_dir: str | Path = POSTS_DIR):
         self.posts_dir = Path(posts_dir)
         self._cache_timestamp: Optional[float] = None
-        
-        # Configure Markdown parser with extensions
-        self.md = markdown.Markdown(
+        self._slug_index: Dict[str, BlogPost] = {}
+        self._slug_order: Dict[str, int] = {}
+        self._tag_index: Dict[str, List[BlogPost]] = {}
+        # Rate-limit the on-disk freshness check; files change rarely
+        # but every request funnels through get_all_posts()
+        self._last_check: float = 0.0
+        self._check_interval: float = 2.0
+        # The Markdown parser carries state across reset()/convert(),
+        # and the deferred render runs on request threads -- keep one
+        # parser per thread so concurrent renders can't interleave
+        self._local = threading.local()
+
+    @staticmethod
+    def _make_markdown() -> markdown.Markdown:
+        """Configure a Markdown parser with extensions."""
+        return markdown.Markdown(
             extensions=[
                 FencedCodeExtension(),
                 CodeHiliteExtension(
                     css_class="highlight",
                     linenums=False,
-                    guess_lang=True,
+                    # guess_lang runs every Pygments lexer against each
+                    # unlabelled code block; unlabelled blocks fall back
+                    # to the near-free TextLexer instead
+                    guess_lang=False,
                 ),
                 TableExtension(),
                 TocExtension(
@@ -118,18 +178,36 @@ class BlogEngine:
             output_format="html5",
         )
 
+    @property
+    def md(self) -> markdown.Markdown:
+        """Markdown parser for the current thread."""
+        md = getattr(self._local, "md", None)
+        if md is None:
+            md = self._local.md = self._make_markdown()
+        return md
+
+    def _render_html(self, text: str) -> str:
+        """Render Markdown text to HTML (used lazily by BlogPost)."""
+        # Reset markdown parser state between documents
+        md = self.md
+        md.reset()
+        return md.convert(text)
+
     def _calculate_reading_time(self, text: str) -> int:
         """Calculate estimated reading time in minutes."""
-        words = len(text.split())
+        # A plain space count is a single C-level scan and is accurate
+        # enough for a words-per-minute estimate
+        words = text.count(" ") + 1
         reading_time = max(1, round(words / 200))  # Assume 200 WPM
         return reading_time
 
     def _generate_excerpt(self, content: str, max_length: int = 160) -> str:
         """Generate excerpt from content."""
-        # Remove HTML tags
-        clean_text = re.sub(r"<[^>]+>", "", content)
-        # Remove extra whitespace
-        clean_text = " ".join(clean_text.split())
+        # Remove HTML tags (skip the regex entirely when there are none)
+        clean_text = _HTML_TAG_RE.sub("", content) if "<" in content else content
+        # Collapse whitespace in one regex pass instead of building a
+        # token list and joining it
+        clean_text = _WS_RE.sub(" ", clean_text).strip()
         
         if len(clean_text) <= max_length:
             return clean_text
@@ -144,7 +222,7 @@ class BlogEngine:
         name = filename.rsplit(".", 1)[0]
         
         # Check if filename starts with date pattern (YYYY-MM-DD-)
-        date_pattern = re.match(r"^\d{4}-\d{2}-\d{2}-(.+)$", name)
+        date_pattern = _SLUG_DATE_RE.match(name)
         if date_pattern:
             return date_pattern.group(1)
         
@@ -172,7 +250,7 @@ class BlogEngine:
             else:
                 # Try to extract from filename
                 filename = filepath.name
-                date_match = re.match(r"^(\d{4}-\d{2}-\d{2})", filename)
+                date_match = _DATE_PREFIX_RE.match(filename)
                 if date_match:
                     date = datetime.strptime(date_match.group(1), DATE_FORMAT)
                 else:
@@ -186,20 +264,20 @@ class BlogEngine:
             if isinstance(tags, str):
                 tags = [t.strip() for t in tags.split(",")]
             
-            # Reset markdown parser state
-            self.md.reset()
-            
-            # Render content
-            content_html = self.md.convert(post.content)
-            
-            # Generate excerpt
-            excerpt = post.get("excerpt") or post.get("description") or self._generate_excerpt(content_html)
-            
-            return BlogPost(
+            # Prefer a frontmatter excerpt so rendering stays deferred;
+            # without one, excerpting raw Markdown would leak syntax
+            # (#, **, fences) into list pages, so render the body now
+            # and derive the excerpt from the HTML as before
+            excerpt = post.get("excerpt") or post.get("description")
+            content_html = None
+            if not excerpt:
+                content_html = self._render_html(post.content)
+                excerpt = self._generate_excerpt(content_html)
+
+            parsed = BlogPost(
                 slug=slug,
                 title=title,
                 date=date,
-                content_html=content_html,
                 content_raw=post.content,
                 excerpt=excerpt,
                 tags=tags,
@@ -208,33 +286,50 @@ class BlogEngine:
                 reading_time=self._calculate_reading_time(post.content),
                 is_draft=is_draft,
                 meta=dict(post.metadata),
+                _render_html=self._render_html,
             )
-            
+            if content_html is not None:
+                # The render was already paid for; seed the memo so the
+                # detail view doesn't convert the same body again
+                parsed._content_html = content_html
+
+            return parsed
+
         except Exception as e:
             print(f"Error parsing {filepath}: {e}")
             return None
 
     def _get_posts_dir_mtime(self) -> float:
         """Get the latest modification time of the posts directory."""
-        if not self.posts_dir.exists():
+        try:
+            latest_mtime = self.posts_dir.stat().st_mtime
+        except OSError:
             return 0.0
-        
-        latest_mtime = self.posts_dir.stat().st_mtime
-        
-        for filepath in self.posts_dir.glob("*.md"):
-            mtime = filepath.stat().st_mtime
-            if mtime > latest_mtime:
-                latest_mtime = mtime
-        
+
+        # Single scandir pass: DirEntry.stat() reuses the data readdir
+        # already returned, instead of one stat(2) per glob() match
+        with os.scandir(self.posts_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_mtime:
+                        latest_mtime = mtime
+
         return latest_mtime
 
     def _should_refresh_cache(self) -> bool:
         """Check if cache should be refreshed based on file changes."""
-        current_mtime = self._get_posts_dir_mtime()
-        
         if self._cache_timestamp is None:
             return True
-        
+
+        # Skip the directory scan entirely if we checked recently
+        now = time.monotonic()
+        if now - self._last_check < self._check_interval:
+            return False
+        self._last_check = now
+
+        current_mtime = self._get_posts_dir_mtime()
+
         return current_mtime > self._cache_timestamp
 
     @lru_cache(maxsize=1)
@@ -246,19 +341,34 @@ class BlogEngine:
         when files are modified.
         """
         posts = []
-        
+
         if not self.posts_dir.exists():
             print(f"Warning: Posts directory '{self.posts_dir}' does not exist.")
             return posts
-        
-        for filepath in self.posts_dir.glob("*.md"):
-            post = self._parse_post(filepath)
-            if post:
-                posts.append(post)
-        
+
+        # Parse files in parallel; _parse_post is mostly file I/O plus
+        # frontmatter parsing, and the excerpt-fallback render is safe
+        # across threads thanks to the thread-local parser
+        filepaths = list(self.posts_dir.glob("*.md"))
+        if filepaths:
+            max_workers = min(8, os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                posts = [p for p in executor.map(self._parse_post, filepaths) if p]
+
         # Sort by date (newest first)
         posts.sort(key=lambda p: p.date, reverse=True)
-        
+
+        # Build lookup indexes so single-post and tag queries are O(1)
+        # instead of scanning the whole list per request
+        self._slug_index = {p.slug: p for p in posts}
+        self._slug_order = {p.slug: i for i, p in enumerate(posts)}
+        self._tag_index = {}
+        for p in posts:
+            if p.is_draft:
+                continue
+            for tag in p.tags_lower:
+                self._tag_index.setdefault(tag, []).append(p)
+
         return posts
 
     def get_all_posts(self, include_drafts: bool = False) -> List[BlogPost]:
@@ -274,8 +384,9 @@ class BlogEngine:
         # Check if we need to refresh the cache
         if self._should_refresh_cache():
             self._load_all_posts_cached.cache_clear()
+            self._get_all_tags_cached.cache_clear()
             self._cache_timestamp = self._get_posts_dir_mtime()
-        
+
         posts = self._load_all_posts_cached(self._cache_timestamp or 0)
         
         if not include_drafts:
@@ -293,13 +404,10 @@ class BlogEngine:
         Returns:
             BlogPost object or None if not found.
         """
-        posts = self.get_all_posts(include_drafts=True)
-        
-        for post in posts:
-            if post.slug == slug:
-                return post
-        
-        return None
+        # Ensure the cache (and with it the slug index) is up to date
+        self.get_all_posts(include_drafts=True)
+
+        return self._slug_index.get(slug)
 
     def get_posts_by_tag(self, tag: str) -> List[BlogPost]:
         """
@@ -311,25 +419,50 @@ class BlogEngine:
         Returns:
             List of BlogPost objects.
         """
-        posts = self.get_all_posts()
-        return [p for p in posts if tag.lower() in [t.lower() for t in p.tags]]
+        # Ensure the cache (and with it the tag index) is up to date
+        self.get_all_posts()
+
+        return list(self._tag_index.get(tag.lower(), []))
 
-    def get_all_tags(self) -> Dict[str, int]:
+    @lru_cache(maxsize=1)
+    def _get_all_tags_cached(self, cache_key: float) -> Dict[str, int]:
         """
-        Get all tags with their post counts.
-        
-        Returns:
-            Dictionary mapping tags to post counts.
+        Build the tag histogram with LRU cache.
+
+        The cache_key parameter is used to invalidate the cache
+        when files are modified, mirroring _load_all_posts_cached.
         """
         tags: Dict[str, int] = {}
-        
+
         for post in self.get_all_posts():
             for tag in post.tags:
                 tag_lower = tag.lower()
                 tags[tag_lower] = tags.get(tag_lower, 0) + 1
-        
+
         return dict(sorted(tags.items(), key=lambda x: x[1], reverse=True))
 
+    def get_all_tags(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Get all tags with their post counts.
+
+        Args:
+            limit: If set, return only the most-used `limit` tags.
+
+        Returns:
+            Dictionary mapping tags to post counts.
+        """
+        # get_all_posts() refreshes _cache_timestamp (and clears this
+        # cache) if files changed, so call it before using the key
+        self.get_all_posts()
+        tags = self._get_all_tags_cached(self._cache_timestamp or 0)
+
+        if limit is None:
+            return tags
+
+        # Top-K selection beats sorting the full histogram when only a
+        # capped sidebar is displayed
+        return dict(heapq.nlargest(limit, tags.items(), key=lambda x: x[1]))
+
     def get_recent_posts(self, limit: int = 5) -> List[BlogPost]:
         """
         Get the most recent posts.
@@ -353,22 +486,24 @@ class BlogEngine:
         Returns:
             List of related BlogPost objects.
         """
-        all_posts = self.get_all_posts()
-        
-        # Score posts by number of shared tags
-        scored_posts = []
-        for p in all_posts:
-            if p.slug == post.slug:
-                continue
-            
-            shared_tags = len(set(t.lower() for t in p.tags) & set(t.lower() for t in post.tags))
-            if shared_tags > 0:
-                scored_posts.append((shared_tags, p))
-        
-        # Sort by score (highest first) and return top results
-        scored_posts.sort(key=lambda x: x[0], reverse=True)
-        
-        return [p for _, p in scored_posts[:limit]]
+        # Ensure the cache (and with it the tag index) is up to date
+        self.get_all_posts()
+
+        # Only posts sharing at least one tag can be related, so score
+        # via the tag index instead of scanning the whole corpus
+        scores: Counter = Counter()
+        for tag in post.tags_lower:
+            for p in self._tag_index.get(tag, ()):
+                if p.slug != post.slug:
+                    scores[p.slug] += 1
+
+        # Most shared tags first, newest first among ties. (most_common
+        # alone tie-breaks by insertion order, which here follows the
+        # hash-seed-dependent frozenset iteration above.)
+        order = self._slug_order
+        top = heapq.nsmallest(limit, scores.items(),
+                              key=lambda kv: (-kv[1], order[kv[0]]))
+        return [self._slug_index[slug] for slug, _ in top]
 
     def search_posts(self, query: str) -> List[BlogPost]:
         """
@@ -386,7 +521,7 @@ class BlogEngine:
         for post in self.get_all_posts():
             if (query_lower in post.title.lower() or 
                 query_lower in post.content_raw.lower() or
-                any(query_lower in tag.lower() for tag in post.tags)):
+                any(query_lower in tag for tag in post.tags_lower)):
                 results.append(post)
         
         return results
@@ -394,13 +529,20 @@ class BlogEngine:
     def clear_cache(self) -> None:
         """Clear the post cache."""
         self._load_all_posts_cached.cache_clear()
+        self._get_all_tags_cached.cache_clear()
+        self._slug_index = {}
+        self._slug_order = {}
+        self._tag_index = {}
         self._cache_timestamp = None
 
 
-# Global blog engine instance
-blog_engine = BlogEngine()
+# Global blog engine instance, created lazily on first use
+_blog_engine: Optional[BlogEngine] = None
 
 
 def get_blog_engine() -> BlogEngine:
     """Get the global blog engine instance."""
-    return blog_engine
\ No newline at end of file
+    global _blog_engine
+    if _blog_engine is None:
+        _blog_engine = BlogEngine()
+    return _blog_engine
\ No newline at end of file
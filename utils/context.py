@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import json
+import operator
 import os
 import re
+import sys
+
+import orjson
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 MONTHS_EN = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
              "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+URL_PREFIXES = ("http://", "https://")
 ALLOWED_PRECISIONS = {"year", "month", "day"}
 ALLOWED_TIMELINE_TYPES = {"work", "education", "project"}  # istersen genişlet
 DOT_PALETTE = ["bg-zinc-100", "bg-zinc-400", "bg-zinc-500", "bg-zinc-600", "bg-zinc-700", "bg-zinc-800"]
@@ -35,69 +40,58 @@ def _is_non_empty_str(x: Any) -> bool:
 
 
 def _looks_like_email(s: str) -> bool:
-    return bool(re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", s.strip()))
+    return bool(EMAIL_RE.match(s.strip()))
 
 
 def _looks_like_url(s: str) -> bool:
+    s = s.strip()
+    # Cheap prefix test before paying for a full urlparse
+    if not s.startswith(URL_PREFIXES):
+        return False
     try:
-        u = urlparse(s.strip())
-        return u.scheme in {"http", "https"} and bool(u.netloc)
+        return bool(urlparse(s).netloc)
     except Exception:
         return False
 
 
+# precision -> (predicate, requirement shown in the error message)
+_PRECISION_CHECKS = {
+    "year": (lambda d: d.month == 1 and d.day == 1, "MM-DD = 01-01"),
+    "month": (lambda d: d.day == 1, "DD = 01"),
+    "day": (lambda d: True, ""),
+}
+
+
 def _check_precision_consistency(d: date, precision: str, path: str, errors: List[str]) -> None:
-    if precision not in ALLOWED_PRECISIONS:
+    check = _PRECISION_CHECKS.get(precision)
+    if check is None:
         errors.append(f"{path}: precision must be one of {sorted(ALLOWED_PRECISIONS)} (got: {repr(precision)})")
         return
-    if precision == "year":
-        if not (d.month == 1 and d.day == 1):
-            errors.append(f"{path}: precision='year' requires MM-DD = 01-01 (got: {d.isoformat()})")
-    elif precision == "month":
-        if d.day != 1:
-            errors.append(f"{path}: precision='month' requires DD = 01 (got: {d.isoformat()})")
-
-
-def _format_date(d: date, precision: str) -> str:
-    # Basit display format (istersen TR/EN ay isimleri ekleyebiliriz)
-    if precision == "year":
-        return str(d.year)
-    if precision == "month":
-        return d.strftime("%b %Y")  # Jan 2022
-    return d.strftime("%d %b %Y")  # 23 Apr 2012
-
-
-def _format_range(item: Dict[str, Any]) -> str:
-    sd: date = item["_parsed_start"]
-    sp: str = item.get("start_precision", "day")
-    start_txt = _format_date(sd, sp)
-
-    if item.get("is_current") is True or item.get("end_date") is None:
-        return f"{start_txt} – Present"
-
-    ed: date = item["_parsed_end"]
-    ep: str = item.get("end_precision", "day")
-    end_txt = _format_date(ed, ep)
-
-    return f"{start_txt} – {end_txt}"
-
-
-def _timeline_title(item: Dict[str, Any]) -> str:
-    if item.get("type") == "work":
-        return item.get("role", "") or ""
-    if item.get("type") == "education":
-        return item.get("degree", "") or ""
-    if item.get("type") == "project":
-        return item.get("title", "") or ""
-    return item.get("title", "")
-
-
-def _timeline_subtitle(item: Dict[str, Any]) -> str:
-    org = item.get("organization", "") or ""
-    desc = item.get("description", "") or ""
-    if org and desc:
-        return f"{org} • {desc}"
-    return org or desc
+    predicate, requirement = check
+    if not predicate(d):
+        errors.append(f"{path}: precision={precision!r} requires {requirement} (got: {d.isoformat()})")
+
+
+def _looks_like_iso_date(s: str) -> bool:
+    # Strict 'YYYY-MM-DD' shape check without a regex: str.isdigit is a
+    # C loop over at most four chars
+    return (
+        len(s) == 10
+        and s[4] == "-"
+        and s[7] == "-"
+        and s[0:4].isdigit()
+        and s[5:7].isdigit()
+        and s[8:10].isdigit()
+    )
+
+
+@lru_cache(maxsize=256)
+def _iso_to_date(s: str) -> Optional[date]:
+    """Parse 'YYYY-MM-DD', memoized (validate + derive re-parse the same strings)."""
+    try:
+        return date.fromisoformat(s)
+    except ValueError:
+        return None
 
 
 def _parse_iso_date(
@@ -110,34 +104,28 @@ def _parse_iso_date(
     """
     - s: "YYYY-MM-DD" (JSON'dan gelen)
     - errors verilirse: hata mesajı ekler
-    - require_regex=True: formatı regex ile kesin kontrol eder
+    - require_regex=True: formatı kesin kontrol eder
     """
-    if not isinstance(s, str) or (require_regex and not DATE_RE.match(s)):
+    if not isinstance(s, str) or (require_regex and not _looks_like_iso_date(s)):
         if errors is not None:
             errors.append(f"{path}: must be 'YYYY-MM-DD' (got: {repr(s)})")
         return None
 
-    try:
-        return date.fromisoformat(s)
-    except ValueError:
-        if errors is not None:
-            errors.append(f"{path}: invalid calendar date (got: {repr(s)})")
-        return None
-
-
-def _fmt_month_year(d: date) -> str:
-    return f"{MONTHS_EN[d.month - 1]} {d.year}"
+    d = _iso_to_date(s)
+    if d is None and errors is not None:
+        errors.append(f"{path}: invalid calendar date (got: {repr(s)})")
+    return d
 
 
 def _build_display_range(item: Dict[str, Any], start_dt: date, end_dt: Optional[date]) -> str:
-    start_txt = _fmt_month_year(start_dt)
+    months = MONTHS_EN  # local bind: LOAD_FAST instead of a global lookup per date
+    start_txt = f"{months[start_dt.month - 1]} {start_dt.year}"
 
     is_current = item.get("is_current") is True
     if is_current or end_dt is None:
         return f"{start_txt} - Present"
 
-    end_txt = _fmt_month_year(end_dt)
-    return f"{start_txt} - {end_txt}"
+    return f"{start_txt} - {months[end_dt.month - 1]} {end_dt.year}"
 
 
 def _build_display_title(item: Dict[str, Any]) -> str:
@@ -161,44 +149,51 @@ def _build_display_subtitle(item: Dict[str, Any]) -> str:
     return org or desc
 
 
-def _tailor_timeline_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    tailored: List[Dict[str, Any]] = []
+def _decorate_timeline_item(item: Dict[str, Any]) -> Tuple[Tuple[int, int], Dict[str, Any]]:
+    """Copy one timeline item, add display fields, and return it with its sort key."""
+    it = dict(item)  # shallow copy
 
-    for item in items:
-        if not isinstance(item, dict):
-            continue
+    # Reuse the dates validate() already parsed; fall back to
+    # parsing only when this runs on unvalidated data
+    start_dt = it.pop("_parsed_start", None) or _parse_iso_date(it.get("start_date"))
+    end_dt = it.pop("_parsed_end", None) or _parse_iso_date(it.get("end_date"))
 
-        it = dict(item)  # shallow copy
+    # Display alanları (Jinja2’de direkt kullanacaksın)
+    if start_dt:
+        it["display_range"] = _build_display_range(it, start_dt, end_dt)
+    else:
+        it["display_range"] = ""  # istersen "Unknown" yazdırabilirsin
 
-        start_dt = _parse_iso_date(it.get("start_date"))
-        end_dt = _parse_iso_date(it.get("end_date"))
-
-        # Display alanları (Jinja2’de direkt kullanacaksın)
-        if start_dt:
-            it["display_range"] = _build_display_range(it, start_dt, end_dt)
-        else:
-            it["display_range"] = ""  # istersen "Unknown" yazdırabilirsin
+    it["display_title"] = _build_display_title(it)
+    it["display_subtitle"] = _build_display_subtitle(it)
 
-        it["display_title"] = _build_display_title(it)
-        it["display_subtitle"] = _build_display_subtitle(it)
+    # Integer sort key: (is_current, start ordinal) -- tuple-of-int
+    # compares are much cheaper than date object compares
+    sort_key = (
+        1 if it.get("is_current") is True else 0,
+        start_dt.toordinal() if start_dt else 0,
+    )
+    return sort_key, it
 
-        # Sort için internal key’ler
-        it["_start_dt"] = start_dt or date.min
-        it["_is_current"] = 1 if it.get("is_current") is True else 0
 
-        tailored.append(it)
+def _tailor_timeline_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # (sort_key, item) çiftleri: sort key'i item'a yazmak yerine burada
+    # tutuyoruz, böylece sonradan temizlik turu gerekmiyor
+    # (exact-type check: json.loads only ever yields plain dicts)
+    decorated = [_decorate_timeline_item(item) for item in items if type(item) is dict]
 
     # current olanlar önce, sonra start_date desc
-    tailored.sort(key=lambda x: (x["_is_current"], x["_start_dt"]), reverse=True)
+    decorated.sort(key=operator.itemgetter(0), reverse=True)
 
     # ✅ Dot renkleri: en yeni açık, eskidikçe koyu
-    for idx, it in enumerate(tailored):
-        it["dot_class"] = DOT_PALETTE[idx] if idx < len(DOT_PALETTE) else DOT_PALETTE[-1]
-    
-    # internal alanları temizle
-    for it in tailored:
-        it.pop("_start_dt", None)
-        it.pop("_is_current", None)
+    palette = DOT_PALETTE
+    palette_size = len(palette)
+    last_color = palette[-1]
+
+    tailored: List[Dict[str, Any]] = []
+    for idx, (_, it) in enumerate(decorated):
+        it["dot_class"] = palette[idx] if idx < palette_size else last_color
+        tailored.append(it)
 
     return tailored
 
@@ -208,6 +203,9 @@ class ContextManager:
     def __init__(self, context_file: str = "./data/context.json") -> None:
         self.context_file = context_file
         self._mtime: Optional[float] = None
+        # (mtime, derived ctx) -- skips load+validate+derive when the
+        # file hasn't changed since the last full reload
+        self._derived_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
         # dışarıya vereceğin alanlar
         self.data: Dict[str, Any] = {}
@@ -231,7 +229,8 @@ class ContextManager:
         try:
             mtime = os.path.getmtime(self.context_file)
         except FileNotFoundError:
-            raise
+            # Dosya geçici olarak yoksa eldeki veriyle devam et
+            return
 
         if self._mtime is None or mtime != self._mtime:
             self.reload(force=True)
@@ -240,13 +239,20 @@ class ContextManager:
         if not force:
             return self.reload_if_changed()
 
-        ctx = self._load_json()
+        mtime = os.path.getmtime(self.context_file)
+
+        if self._derived_cache is not None and self._derived_cache[0] == mtime:
+            # Unchanged file: reuse the already-derived ctx
+            ctx = self._derived_cache[1]
+        else:
+            ctx = self._load_json()
 
-        result = self.validate(ctx)
-        if not result.ok:
-            raise ContextValidationError(result.errors, result.warnings)
+            result = self.validate(ctx)
+            if not result.ok:
+                raise ContextValidationError(result.errors, result.warnings)
 
-        ctx = self._build_derived(ctx)
+            ctx = self._build_derived(ctx)
+            self._derived_cache = (mtime, ctx)
 
         # assign
         self.data = ctx
@@ -262,14 +268,11 @@ class ContextManager:
         self.images = self.assets.get("images", {}) if isinstance(self.assets.get("images"), dict) else {}
         self.files = self.assets.get("files", {}) if isinstance(self.assets.get("files"), dict) else {}
 
-        self._mtime = os.path.getmtime(self.context_file)
+        self._mtime = mtime
 
-    def template_kwargs(self) -> Dict[str, Any]:
-        """
-        render_template'e direkt **kwargs olarak basılacak dict.
-        Hem "ctx" hem de shortcut alanlar var.
-        """
-        return {
+        # Rebuilt once per reload; template_kwargs() hands out the same
+        # dict on every request instead of re-allocating it
+        self._template_kwargs = {
             "ctx": self.data,
             "personal_info": self.personal,
             "about_me": self.about,
@@ -281,11 +284,20 @@ class ContextManager:
             "files": self.files,
         }
 
+    def template_kwargs(self) -> Dict[str, Any]:
+        """
+        render_template'e direkt **kwargs olarak basılacak dict.
+        Hem "ctx" hem de shortcut alanlar var.
+
+        Jinja sadece okuduğu için aynı dict'i paylaşmak güvenli.
+        """
+        return self._template_kwargs
+
     # --------- Load / Validate / Derived ---------
 
     def _load_json(self) -> Dict[str, Any]:
-        with open(self.context_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(self.context_file, "rb") as f:
+            data = orjson.loads(f.read())
         if not isinstance(data, dict):
             raise ContextValidationError([f"root: must be an object (dict), got {type(data).__name__}"])
         return data
@@ -328,18 +340,30 @@ class ContextManager:
             else:
                 for i, item in enumerate(tl):
                     path = f"about_me.timeline[{i}]"
-                    if not isinstance(item, dict):
+                    if type(item) is not dict:
                         errors.append(f"{path}: must be object")
                         continue
 
                     ttype = item.get("type")
+                    if isinstance(ttype, str):
+                        # Intern the small enum-like strings so later
+                        # == checks short-circuit on pointer identity
+                        ttype = sys.intern(ttype)
+                        item["type"] = ttype
                     if ttype not in ALLOWED_TIMELINE_TYPES:
                         warnings.append(f"{path}.type: expected {sorted(ALLOWED_TIMELINE_TYPES)} (got {repr(ttype)})")
 
                     sp = item.get("start_precision")
+                    if isinstance(sp, str):
+                        sp = sys.intern(sp)
+                        item["start_precision"] = sp
                     if sp not in ALLOWED_PRECISIONS:
                         errors.append(f"{path}.start_precision: must be one of {sorted(ALLOWED_PRECISIONS)}")
                     sd = _parse_iso_date(item.get("start_date"), path=f"{path}.start_date", errors=errors)
+                    if sd:
+                        # stash for _tailor_timeline_items so the derive
+                        # step doesn't re-parse the same string
+                        item["_parsed_start"] = sd
                     if sd and isinstance(sp, str):
                         _check_precision_consistency(sd, sp, f"{path}.start_date", errors)
 
@@ -354,9 +378,14 @@ class ContextManager:
                     else:
                         if ed_raw is not None:
                             ep = item.get("end_precision")
+                            if isinstance(ep, str):
+                                ep = sys.intern(ep)
+                                item["end_precision"] = ep
                             if ep not in ALLOWED_PRECISIONS:
                                 errors.append(f"{path}.end_precision: must be one of {sorted(ALLOWED_PRECISIONS)} when end_date set")
                             ed = _parse_iso_date(ed_raw, path=f"{path}.end_date", errors=errors)
+                            if ed:
+                                item["_parsed_end"] = ed
                             if ed and sd and ed < sd:
                                 errors.append(f"{path}: end_date must be >= start_date")
                             if ed and isinstance(ep, str):
@@ -376,7 +405,7 @@ class ContextManager:
                     # thesis link kontrol (opsiyonel)
                     th = item.get("thesis")
                     if th is not None:
-                        if not isinstance(th, dict):
+                        if type(th) is not dict:
                             errors.append(f"{path}.thesis: must be object")
                         else:
                             link = th.get("link")
@@ -413,34 +442,30 @@ class ContextManager:
           - display_title
           - display_subtitle
         ekler ve sıralar.
-        
+
         Hobbies background imagelarına static/{IMAGE_PATH} prefix ekler.
+
+        Ctx _load_json'dan taze geldiği için (dışarıda alias yok)
+        kopyasız, yerinde mutasyon güvenli.
         """
-        ctx = dict(ctx)
-        about = dict(ctx.get("about_me", {}))
-        tl = about.get("timeline", [])
-        if not isinstance(tl, list):
-            ctx["about_me"] = about
-        else:
-            about["timeline"] = _tailor_timeline_items(tl)
-            ctx["about_me"] = about
+        about = ctx.get("about_me")
+        if isinstance(about, dict):
+            tl = about.get("timeline")
+            if isinstance(tl, list):
+                about["timeline"] = _tailor_timeline_items(tl)
 
         # Add images/ prefix to hobby background paths (url_for adds static/ automatically)
-        hobbies = ctx.get("hobbies", {})
+        hobbies = ctx.get("hobbies")
         if isinstance(hobbies, dict):
-            hobbies = dict(hobbies)
-            for hobby_id, hobby_data in hobbies.items():
-                if isinstance(hobby_data, dict):
-                    hobby_data = dict(hobby_data)
-                    if "background" in hobby_data and isinstance(hobby_data["background"], str):
-                        bg = hobby_data["background"]
+            for hobby_data in hobbies.values():
+                if type(hobby_data) is dict:
+                    bg = hobby_data.get("background")
+                    if isinstance(bg, str):
                         # Remove static/ prefix if present, ensure images/ prefix only
-                        bg = bg.replace("static/", "")
+                        if bg.startswith("static/"):
+                            bg = bg[7:]
                         if not bg.startswith(IMAGE_PATH):
-                            hobby_data["background"] = f"{IMAGE_PATH}{bg}"
-                        else:
-                            hobby_data["background"] = bg
-                    hobbies[hobby_id] = hobby_data
-            ctx["hobbies"] = hobbies
-        
+                            bg = f"{IMAGE_PATH}{bg}"
+                        hobby_data["background"] = bg
+
         return ctx
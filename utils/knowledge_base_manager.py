@@ -6,19 +6,23 @@ Handles loading and caching of terminal command data from knowledge_base.json
 
 from __future__ import annotations
 
-import json
+import logging
 import os
+import time
 from dataclasses import dataclass, field
-from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 
 # Configuration
 KB_FILE = Path("./data/knowledge_base.json")
 
+logger = logging.getLogger(__name__)
+
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """Represents a single terminal command."""
     command: str
@@ -31,7 +35,7 @@ class Command:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Terminal:
     """Represents a terminal window with multiple commands."""
     id: str
@@ -56,6 +60,15 @@ class KnowledgeBaseManager:
     def __init__(self, kb_file: str | Path = KB_FILE):
         self.kb_file = Path(kb_file)
         self._cache_timestamp: Optional[float] = None
+        # Debounce the freshness stat; the file rarely changes but
+        # get_terminals() runs on every homepage render
+        self._last_stat_time: float = 0.0
+        self._terminals: Optional[List[Terminal]] = None
+        self._terminal_index: Dict[str, Terminal] = {}
+        # Derived forms, built once per (re)load so renders and JSON
+        # responses never re-serialize per request
+        self._terminals_dicts: List[Dict[str, Any]] = []
+        self._terminals_json: bytes = b"[]"
 
     def _get_kb_file_mtime(self) -> float:
         """Get the modification time of the knowledge base file."""
@@ -65,31 +78,30 @@ class KnowledgeBaseManager:
 
     def _should_refresh_cache(self) -> bool:
         """Check if cache should be refreshed based on file changes."""
-        current_mtime = self._get_kb_file_mtime()
-        
         if self._cache_timestamp is None:
             return True
-        
+
+        # Skip the stat syscall when we checked less than a second ago
+        now = time.monotonic()
+        if now - self._last_stat_time < 1.0:
+            return False
+        self._last_stat_time = now
+
+        current_mtime = self._get_kb_file_mtime()
+
         return current_mtime > self._cache_timestamp
 
-    @lru_cache(maxsize=1)
-    def _load_terminals_cached(self, cache_key: float) -> List[Terminal]:
-        """
-        Load terminals with LRU cache.
-        
-        The cache_key parameter is used to invalidate the cache
-        when the file is modified.
-        """
+    def _load_terminals(self) -> List[Terminal]:
+        """Load terminals from the knowledge base file."""
         terminals = []
         
         if not self.kb_file.exists():
-            print(f"Warning: Knowledge base file '{self.kb_file}' does not exist.")
+            logger.warning("Knowledge base file %s does not exist.", self.kb_file)
             return terminals
         
         try:
-            with open(self.kb_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
+            data = orjson.loads(self.kb_file.read_bytes())
+
             terminals_data = data.get("terminals", [])
             
             for term_data in terminals_data:
@@ -106,8 +118,8 @@ class KnowledgeBaseManager:
                     commands=commands,
                 ))
         
-        except Exception as e:
-            print(f"Error loading knowledge base: {e}")
+        except Exception:
+            logger.exception("Error loading knowledge base")
         
         return terminals
 
@@ -119,12 +131,34 @@ class KnowledgeBaseManager:
             List of Terminal objects.
         """
         # Check if we need to refresh the cache
-        if self._should_refresh_cache():
-            self._load_terminals_cached.cache_clear()
+        if self._terminals is None or self._should_refresh_cache():
+            self._terminals = self._load_terminals()
+            self._terminal_index = {t.id: t for t in self._terminals}
+            self._terminals_dicts = [t.to_dict() for t in self._terminals]
+            self._terminals_json = orjson.dumps(self._terminals_dicts)
             self._cache_timestamp = self._get_kb_file_mtime()
-        
-        terminals = self._load_terminals_cached(self._cache_timestamp or 0)
-        return terminals
+
+        return self._terminals
+
+    def get_terminals_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Get all terminals as template-ready dicts.
+
+        The dicts are built once per (re)load, so callers can hand them
+        straight to render_template without per-request conversion.
+        """
+        self.get_terminals()
+        return self._terminals_dicts
+
+    def get_terminals_json(self) -> bytes:
+        """
+        Get all terminals pre-serialized as JSON bytes.
+
+        Suitable for returning directly in a Response with
+        mimetype="application/json" -- zero per-request serialization.
+        """
+        self.get_terminals()
+        return self._terminals_json
 
     def get_terminal_by_id(self, terminal_id: str) -> Optional[Terminal]:
         """
@@ -136,24 +170,28 @@ class KnowledgeBaseManager:
         Returns:
             Terminal object or None if not found.
         """
-        terminals = self.get_terminals()
-        
-        for terminal in terminals:
-            if terminal.id == terminal_id:
-                return terminal
-        
-        return None
+        # Ensure the cache (and with it the id index) is up to date
+        self.get_terminals()
+
+        return self._terminal_index.get(terminal_id)
 
     def clear_cache(self) -> None:
         """Clear the terminal cache."""
-        self._load_terminals_cached.cache_clear()
+        self._terminals = None
+        self._terminal_index = {}
+        self._terminals_dicts = []
+        self._terminals_json = b"[]"
         self._cache_timestamp = None
+        self._last_stat_time = 0.0
 
 
-# Global knowledge base manager instance
-kb_manager = KnowledgeBaseManager()
+# Global knowledge base manager instance, created lazily on first use
+_kb_manager: Optional[KnowledgeBaseManager] = None
 
 
 def get_kb_manager() -> KnowledgeBaseManager:
     """Get the global knowledge base manager instance."""
-    return kb_manager
+    global _kb_manager
+    if _kb_manager is None:
+        _kb_manager = KnowledgeBaseManager()
+    return _kb_manager
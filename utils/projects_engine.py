@@ -7,15 +7,19 @@ Handles both GitHub repositories and local Markdown project descriptions.
 from __future__ import annotations
 
 import os
-import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
-import frontmatter
 import markdown
+import yaml
 from markdown.extensions.codehilite import CodeHiliteExtension
 from markdown.extensions.fenced_code import FencedCodeExtension
 from markdown.extensions.tables import TableExtension
@@ -24,7 +28,20 @@ from markdown.extensions.tables import TableExtension
 # Configuration
 PROJECTS_DIR = Path("./projects")
 DEFAULT_AUTHOR = "Muhsin Kompas"
-DATE_FORMAT = "%Y-%m-%d"
+
+# libyaml-backed loader when available; project frontmatter is shallow
+# key: value YAML, which the C loader parses an order of magnitude faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared lowercase tag sets: portfolios repeat the same handful of tags,
+# so identical sets collapse to one frozenset of interned strings
+_TAG_SET_CACHE: Dict[frozenset, frozenset] = {}
+
+
+def _shared_tag_set(tags: List[str]) -> frozenset:
+    """Return a canonical frozenset of lowercased, interned tags."""
+    tag_set = frozenset(sys.intern(t.lower()) for t in tags)
+    return _TAG_SET_CACHE.setdefault(tag_set, tag_set)
 
 
 @dataclass
@@ -33,7 +50,6 @@ class Project:
     slug: str
     title: str
     description: str
-    content_html: str
     content_raw: str
     tags: List[str] = field(default_factory=list)
     date: Optional[datetime] = None
@@ -46,7 +62,34 @@ class Project:
     stars: int = 0
     forks: int = 0
     is_draft: bool = False
-    meta: Dict[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=dict)
+    # Deferred rendering: list views never read content_html, so the
+    # Markdown conversion runs on first access instead of at load time
+    _render_html: Optional[Callable[[str], str]] = field(default=None, repr=False)
+    _content_html: Optional[str] = field(default=None, repr=False)
+    # Lowercased tag set, derived once so tag filtering is a hash lookup
+    tags_lower: frozenset = field(init=False, repr=False)
+    # Numeric ordering key: float compares are much cheaper than
+    # datetime compares, and dateless projects need no sentinel object
+    sort_key: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.tags_lower = _shared_tag_set(self.tags)
+        self.sort_key = self.date.timestamp() if self.date else 0.0
+
+    @property
+    def content_html(self) -> str:
+        """Rendered HTML content, produced lazily on first access."""
+        if self._content_html is None:
+            if self._render_html is None:
+                return ""
+            self._content_html = self._render_html(self.content_raw)
+        return self._content_html
+
+    @property
+    def content(self) -> str:
+        """Alias for the rendered HTML, as templates expect it."""
+        return self.content_html
 
     @property
     def date_formatted(self) -> str:
@@ -87,6 +130,18 @@ class Project:
         }
 
 
+@dataclass
+class _CachedProjects:
+    """One generation of loaded projects plus derived lookup structures."""
+    projects: List[Project]
+    public: List[Project]  # projects minus drafts, same order
+    featured: List[Project]  # public projects flagged featured
+    non_featured: List[Project]  # public projects without the flag
+    tag_index: Dict[str, List[Project]]
+    tag_counts: Dict[str, int]
+    by_slug: Dict[str, Project]  # includes drafts, like the old scan
+
+
 class ProjectsEngine:
     """
     Projects Portfolio Engine.
@@ -98,15 +153,29 @@ class ProjectsEngine:
     def __init__(self, projects_dir: str | Path = PROJECTS_DIR):
         self.projects_dir = Path(projects_dir)
         self._cache_timestamp: Optional[float] = None
-        
-        # Configure Markdown parser with extensions
-        self.md = markdown.Markdown(
+        # Debounce the freshness check; every public method funnels
+        # through it and the mtime walk stats each file
+        self._last_check_time: float = 0.0
+        # Per-file parse results keyed on (mtime, size), so editing one
+        # project only reparses that file on the next cache rebuild
+        self._file_cache: Dict[Path, tuple[float, int, Project]] = {}
+        # One Markdown instance per thread: the parser keeps internal
+        # state across reset()/convert(), so it must not be shared
+        # between the parse workers
+        self._local = threading.local()
+
+    @staticmethod
+    def _make_markdown() -> markdown.Markdown:
+        """Configure a Markdown parser with extensions."""
+        return markdown.Markdown(
             extensions=[
                 FencedCodeExtension(),
                 CodeHiliteExtension(
                     css_class="highlight",
                     linenums=False,
-                    guess_lang=True,
+                    # guess_lang runs every Pygments lexer against
+                    # unlabelled blocks; our fences name their language
+                    guess_lang=False,
                 ),
                 TableExtension(),
                 "nl2br",
@@ -116,17 +185,74 @@ class ProjectsEngine:
             output_format="html5",
         )
 
+    @property
+    def md(self) -> markdown.Markdown:
+        """Markdown parser for the current thread."""
+        md = getattr(self._local, "md", None)
+        if md is None:
+            md = self._local.md = self._make_markdown()
+        return md
+
+    def _render_html(self, text: str) -> str:
+        """Render Markdown text to HTML with this thread's parser."""
+        # Reset markdown parser state before each conversion
+        md = self.md
+        md.reset()
+        return md.convert(text)
+
     def _generate_excerpt(self, content: str, max_length: int = 200) -> str:
         """Generate excerpt from content."""
-        clean_text = re.sub(r"<[^>]+>", "", content)
-        clean_text = " ".join(clean_text.split())
-        
+        # Single-pass scanner: strip tags and collapse whitespace while
+        # collecting characters, and stop as soon as we have enough for
+        # the excerpt instead of cleaning the whole document first.
+        chars: List[str] = []
+        append = chars.append
+        in_tag = False
+        prev_was_space = True  # swallows leading whitespace
+        budget = max_length + 32  # slack so truncation can find a word boundary
+
+        for ch in content:
+            if in_tag:
+                if ch == ">":
+                    in_tag = False
+            elif ch == "<":
+                in_tag = True
+            elif ch.isspace():
+                if not prev_was_space:
+                    append(" ")
+                    prev_was_space = True
+            else:
+                append(ch)
+                prev_was_space = False
+            if len(chars) >= budget:
+                break
+
+        clean_text = "".join(chars).rstrip()
+
         if len(clean_text) <= max_length:
             return clean_text
-        
+
         truncated = clean_text[:max_length].rsplit(" ", 1)[0]
         return truncated + "..."
 
+    @staticmethod
+    def _split_frontmatter(data: bytes) -> tuple[Dict[str, Any], str]:
+        """Split raw file bytes into (metadata, markdown content)."""
+        # Normalize CRLF up front so files saved on Windows fence-match
+        # the same as LF files
+        if b"\r" in data:
+            data = data.replace(b"\r\n", b"\n")
+        if data.startswith(b"---\n"):
+            end = data.find(b"\n---\n", 3)
+            if end == -1 and data.endswith(b"\n---"):
+                # Closing fence on the last line, no trailing newline
+                end = len(data) - 4
+            if end != -1:
+                meta = yaml.load(data[4:end], Loader=_YAML_LOADER) or {}
+                if isinstance(meta, dict):
+                    return meta, data[end + 5:].decode("utf-8").strip()
+        return {}, data.decode("utf-8").strip()
+
     def _extract_slug_from_filename(self, filename: str) -> str:
         """Extract slug from filename."""
         name = filename.rsplit(".", 1)[0]
@@ -136,66 +262,79 @@ class ProjectsEngine:
         """Parse a single Markdown file into a Project object."""
         try:
             # Load frontmatter and content
-            proj = frontmatter.load(filepath)
-            
+            meta, content = self._split_frontmatter(filepath.read_bytes())
+
             # Skip drafts in production
-            is_draft = proj.get("draft", False)
-            
+            is_draft = meta.get("draft", False)
+
             # Extract metadata
-            title = proj.get("title", "Untitled Project")
-            description = proj.get("description", "")
-            
+            title = meta.get("title", "Untitled Project")
+            description = meta.get("description", "")
+
             # Parse date if available
-            date_str = proj.get("date")
+            date_str = meta.get("date")
             date = None
             if date_str:
                 if isinstance(date_str, datetime):
                     date = date_str
                 else:
+                    # Manual YYYY-MM-DD parse: strptime rebuilds its
+                    # format machinery on every call
                     try:
-                        date = datetime.strptime(str(date_str), DATE_FORMAT)
-                    except:
+                        y, m, d = str(date_str).split("-")
+                        date = datetime(int(y), int(m), int(d))
+                    except ValueError:
                         date = None
             
             # Get slug
-            slug = proj.get("slug") or self._extract_slug_from_filename(filepath.name)
-            
-            # Parse tags and technologies
-            tags = proj.get("tags", [])
+            slug = meta.get("slug") or self._extract_slug_from_filename(filepath.name)
+
+            # Parse tags and technologies; intern them so the same tag
+            # across projects is a single string object
+            tags = meta.get("tags", [])
             if isinstance(tags, str):
                 tags = [t.strip() for t in tags.split(",")]
-            
-            technologies = proj.get("technologies", [])
+            tags = [sys.intern(str(t)) for t in tags]
+
+            technologies = meta.get("technologies", [])
             if isinstance(technologies, str):
                 technologies = [t.strip() for t in technologies.split(",")]
-            
-            # Reset markdown parser state
-            self.md.reset()
-            
-            # Render content
-            content_html = self.md.convert(proj.content)
-            
+            technologies = [sys.intern(str(t)) for t in technologies]
+
+            # Without a frontmatter description the excerpt must come
+            # from the rendered HTML (raw Markdown would leak syntax
+            # into list pages), so rendering can't be deferred here
+            content_html = None
+            if not description:
+                content_html = self._render_html(content)
+                description = self._generate_excerpt(content_html)
+
             # Project type
-            project_type = proj.get("type", "local")
+            project_type = meta.get("type", "local")
             
             return Project(
                 slug=slug,
                 title=title,
-                description=description or self._generate_excerpt(content_html),
-                content_html=content_html,
-                content_raw=proj.content,
+                description=description,
+                content_raw=content,
                 tags=tags,
                 date=date,
                 project_type=project_type,
-                github_url=proj.get("github_url"),
-                demo_url=proj.get("demo_url"),
-                featured_image=proj.get("featured_image") or proj.get("image"),
-                featured=proj.get("featured", False),
+                github_url=meta.get("github_url"),
+                demo_url=meta.get("demo_url"),
+                featured_image=meta.get("featured_image") or meta.get("image"),
+                featured=meta.get("featured", False),
                 technologies=technologies,
-                stars=proj.get("stars", 0),
-                forks=proj.get("forks", 0),
+                stars=meta.get("stars", 0),
+                forks=meta.get("forks", 0),
                 is_draft=is_draft,
-                meta=dict(proj.metadata),
+                # Read-only view over the parsed frontmatter -- no copy,
+                # and cached projects can't be mutated through it
+                meta=MappingProxyType(meta),
+                _render_html=self._render_html,
+                # Seed the memo when the excerpt forced a render, so the
+                # detail view doesn't convert the same body twice
+                _content_html=content_html,
             )
             
         except Exception as e:
@@ -208,67 +347,128 @@ class ProjectsEngine:
             return 0.0
         
         latest_mtime = self.projects_dir.stat().st_mtime
-        
-        for filepath in self.projects_dir.glob("*.md"):
-            mtime = filepath.stat().st_mtime
-            if mtime > latest_mtime:
-                latest_mtime = mtime
-        
+
+        # scandir reuses the stat data readdir already fetched, where
+        # glob would build a Path and issue a fresh stat per file
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_mtime:
+                        latest_mtime = mtime
+
         return latest_mtime
 
     def _should_refresh_cache(self) -> bool:
         """Check if cache should be refreshed based on file changes."""
-        current_mtime = self._get_projects_dir_mtime()
-        
         if self._cache_timestamp is None:
             return True
-        
-        return current_mtime > self._cache_timestamp
+
+        # Skip the stat walk when we checked less than a second ago;
+        # edits show up on the next check, which is fine for this site
+        now = time.monotonic()
+        if now - self._last_check_time < 1.0:
+            return False
+        self._last_check_time = now
+
+        return self._get_projects_dir_mtime() > self._cache_timestamp
 
     @lru_cache(maxsize=1)
-    def _load_all_projects_cached(self, cache_key: float) -> List[Project]:
+    def _load_all_projects_cached(self, cache_key: float) -> _CachedProjects:
         """
         Load all projects with LRU cache.
-        
+
         The cache_key parameter is used to invalidate the cache
-        when files are modified.
+        when files are modified. Derived lookup structures (tag index,
+        tag counts) are built here, once per cache generation.
         """
-        projects = []
-        
+        projects: List[Project] = []
+
         if not self.projects_dir.exists():
             print(f"Warning: Projects directory '{self.projects_dir}' does not exist.")
-            return projects
-        
-        for filepath in self.projects_dir.glob("*.md"):
-            project = self._parse_project(filepath)
-            if project:
-                projects.append(project)
-        
+            return _CachedProjects(projects, [], [], [], {}, {}, {})
+
+        with os.scandir(self.projects_dir) as entries:
+            listing = []
+            for entry in entries:
+                if entry.name.endswith(".md"):
+                    stat = entry.stat()
+                    listing.append((Path(entry.path), stat.st_mtime, stat.st_size))
+
+        # Reuse parse results for files whose (mtime, size) is unchanged
+        # since the last build; only the rest get reparsed
+        to_parse = []
+        for path, mtime, size in listing:
+            hit = self._file_cache.get(path)
+            if hit is not None and hit[0] == mtime and hit[1] == size:
+                projects.append(hit[2])
+            else:
+                to_parse.append((path, mtime, size))
+
+        # Parse changed files in parallel: overlaps the disk reads, and
+        # each worker renders with its own thread-local Markdown parser
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_parse))) as executor:
+                parsed = executor.map(self._parse_project, [p for p, _, _ in to_parse])
+                for (path, mtime, size), project in zip(to_parse, parsed):
+                    if project:
+                        self._file_cache[path] = (mtime, size, project)
+                        projects.append(project)
+
+        # Drop cache entries for files that no longer exist
+        current_paths = {path for path, _, _ in listing}
+        for stale in [p for p in self._file_cache if p not in current_paths]:
+            del self._file_cache[stale]
+
         # Sort by date (newest first) if dates exist, then by title
-        projects.sort(key=lambda p: (p.date or datetime.min, p.title), reverse=True)
-        
-        return projects
+        projects.sort(key=lambda p: (p.sort_key, p.title), reverse=True)
+
+        # Published view plus tag index, built in one pass: the tag
+        # queries never see drafts, so neither does the index
+        public: List[Project] = []
+        featured: List[Project] = []
+        non_featured: List[Project] = []
+        tag_index: Dict[str, List[Project]] = {}
+        for project in projects:
+            if project.is_draft:
+                continue
+            public.append(project)
+            (featured if project.featured else non_featured).append(project)
+            # Walk the tag list, not tags_lower: frozenset iteration
+            # order depends on hash randomization, and the sidebar
+            # tie-breaks equal counts by first-seen order
+            seen = set()
+            for tag in project.tags:
+                tag_lower = tag.lower()
+                if tag_lower not in seen:
+                    seen.add(tag_lower)
+                    tag_index.setdefault(tag_lower, []).append(project)
+        tag_counts = {tag: len(tagged) for tag, tagged in tag_index.items()}
+        by_slug = {p.slug: p for p in projects}
+
+        return _CachedProjects(projects, public, featured, non_featured,
+                               tag_index, tag_counts, by_slug)
+
+    def _cached(self) -> _CachedProjects:
+        """Return the current cache generation, refreshing if stale."""
+        if self._should_refresh_cache():
+            self._load_all_projects_cached.cache_clear()
+            self._cache_timestamp = self._get_projects_dir_mtime()
+
+        return self._load_all_projects_cached(self._cache_timestamp or 0)
 
     def get_all_projects(self, include_drafts: bool = False) -> List[Project]:
         """
         Get all projects, sorted by date (newest first).
-        
+
         Args:
             include_drafts: Whether to include draft projects.
-        
+
         Returns:
             List of Project objects.
         """
-        if self._should_refresh_cache():
-            self._load_all_projects_cached.cache_clear()
-            self._cache_timestamp = self._get_projects_dir_mtime()
-        
-        projects = self._load_all_projects_cached(self._cache_timestamp or 0)
-        
-        if not include_drafts:
-            projects = [p for p in projects if not p.is_draft]
-        
-        return projects
+        cached = self._cached()
+        return cached.projects if include_drafts else cached.public
 
     def get_project_by_slug(self, slug: str) -> Optional[Project]:
         """
@@ -280,13 +480,7 @@ class ProjectsEngine:
         Returns:
             Project object or None if not found.
         """
-        projects = self.get_all_projects(include_drafts=True)
-        
-        for project in projects:
-            if project.slug == slug:
-                return project
-        
-        return None
+        return self._cached().by_slug.get(slug)
 
     def get_featured_projects(self, limit: int = 3) -> List[Project]:
         """
@@ -298,15 +492,14 @@ class ProjectsEngine:
         Returns:
             List of featured Project objects.
         """
-        projects = self.get_all_projects()
-        featured = [p for p in projects if p.featured]
-        
+        cached = self._cached()
+        featured = cached.featured[:limit]
+
         # If not enough featured, add recent projects
         if len(featured) < limit:
-            non_featured = [p for p in projects if not p.featured]
-            featured.extend(non_featured[:limit - len(featured)])
-        
-        return featured[:limit]
+            featured.extend(cached.non_featured[:limit - len(featured)])
+
+        return featured
 
     def get_projects_by_tag(self, tag: str) -> List[Project]:
         """
@@ -318,8 +511,7 @@ class ProjectsEngine:
         Returns:
             List of Project objects.
         """
-        projects = self.get_all_projects()
-        return [p for p in projects if tag.lower() in [t.lower() for t in p.tags]]
+        return list(self._cached().tag_index.get(tag.lower(), []))
 
     def get_all_tags(self) -> Dict[str, int]:
         """
@@ -328,25 +520,23 @@ class ProjectsEngine:
         Returns:
             Dictionary mapping tags to project counts.
         """
-        tags: Dict[str, int] = {}
-        
-        for project in self.get_all_projects():
-            for tag in project.tags:
-                tag_lower = tag.lower()
-                tags[tag_lower] = tags.get(tag_lower, 0) + 1
-        
-        return dict(sorted(tags.items(), key=lambda x: x[1], reverse=True))
+        tag_counts = self._cached().tag_counts
+        return dict(sorted(tag_counts.items(), key=lambda x: x[1], reverse=True))
 
     def clear_cache(self) -> None:
         """Clear the projects cache."""
         self._load_all_projects_cached.cache_clear()
         self._cache_timestamp = None
+        self._last_check_time = 0.0
 
 
-# Global projects engine instance
-projects_engine = ProjectsEngine()
+# Global projects engine instance, created lazily on first use
+_projects_engine: Optional[ProjectsEngine] = None
 
 
 def get_projects_engine() -> ProjectsEngine:
     """Get the global projects engine instance."""
-    return projects_engine
+    global _projects_engine
+    if _projects_engine is None:
+        _projects_engine = ProjectsEngine()
+    return _projects_engine